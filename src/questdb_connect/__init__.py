@@ -1,51 +1,126 @@
+import atexit
+import functools
+import importlib
 import os
+import threading
 import time
 
 import psycopg2
+import psycopg2.pool
 
-from questdb_connect.common import PartitionBy, remove_public_schema
-from questdb_connect.compilers import QDBDDLCompiler, QDBSQLCompiler
-from questdb_connect.dialect import QuestDBDialect, connection_uri, create_engine
-from questdb_connect.identifier_preparer import QDBIdentifierPreparer
-from questdb_connect.inspector import QDBInspector
-from questdb_connect.keywords_functions import get_functions_list, get_keywords_list
-from questdb_connect.table_engine import QDBTableEngine
-from questdb_connect.types import (
-    QUESTDB_TYPES,
-    UUID,
-    Boolean,
-    Byte,
-    Char,
-    Date,
-    Double,
-    Float,
-    GeohashByte,
-    GeohashInt,
-    GeohashLong,
-    GeohashShort,
-    Int,
-    IPv4,
-    Long,
-    Long128,
-    Long256,
-    QDBTypeMixin,
-    Short,
-    String,
-    Symbol,
-    Timestamp,
-    geohash_class,
-    geohash_type_name,
-    resolve_type_from_name,
+from questdb_connect.common import PartitionBy, remove_public_schema, rewrite_query
+from questdb_connect.keywords_functions import (
+    get_functions_list,
+    get_keywords_list,
+    initialize_keywords_functions,
 )
+from questdb_connect.pool import ConnectionPool, PooledConnection
+
+# SQLAlchemy based attributes are imported on first access (PEP 562), so that
+# probing the package or using it as a plain DBAPI does not load SQLAlchemy
+_LAZY_ATTRS = {
+    "QDBDDLCompiler": "questdb_connect.compilers",
+    "QDBSQLCompiler": "questdb_connect.compilers",
+    "QuestDBDialect": "questdb_connect.dialect",
+    "connection_uri": "questdb_connect.dialect",
+    "create_engine": "questdb_connect.dialect",
+    "get_dialect": "questdb_connect.dialect",
+    "QDBIdentifierPreparer": "questdb_connect.identifier_preparer",
+    "QDBInspector": "questdb_connect.inspector",
+    "QDBTableEngine": "questdb_connect.table_engine",
+    **{
+        name: "questdb_connect.types"
+        for name in (
+            "QUESTDB_TYPES",
+            "UUID",
+            "Boolean",
+            "Byte",
+            "Char",
+            "Date",
+            "Double",
+            "Float",
+            "GeohashByte",
+            "GeohashInt",
+            "GeohashLong",
+            "GeohashShort",
+            "Int",
+            "IPv4",
+            "Long",
+            "Long128",
+            "Long256",
+            "QDBTypeMixin",
+            "Short",
+            "String",
+            "Symbol",
+            "Timestamp",
+            "geohash_class",
+            "geohash_type_name",
+            "resolve_type_from_name",
+        )
+    },
+}
+
+
+_LAZY_SUBMODULES = frozenset(
+    (
+        "compilers",
+        "dialect",
+        "identifier_preparer",
+        "inspector",
+        "table_engine",
+        "types",
+    )
+)
+
+__all__ = [
+    "apilevel",
+    "threadsafety",
+    "paramstyle",
+    "Error",
+    "Cursor",
+    "NativeCursor",
+    "cursor_factory",
+    "connect",
+    "connect_pool",
+    "ConnectionPool",
+    "PooledConnection",
+    "PartitionBy",
+    "remove_public_schema",
+    "rewrite_query",
+    "get_functions_list",
+    "get_keywords_list",
+    "initialize_keywords_functions",
+]
+__all__.extend(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        # importing binds the submodule in the package, __getattr__ is not called again
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _LAZY_SUBMODULES)
+
 
 # QuestDB timestamps: https://questdb.io/docs/guides/working-with-timestamps-timezones/
 # The native timestamp format used by QuestDB is a Unix timestamp in microsecond resolution.
 # Although timestamps in nanoseconds will be parsed, the output will be truncated to
 # microseconds. QuestDB does not store time zone information alongside timestamp values
 # and therefore it should be assumed that all timestamps are in UTC.
-if hasattr(time, "tzset"):
-    os.environ["TZ"] = "UTC"
-    time.tzset()
+# The process time zone is switched to UTC by the first connection.
+def _ensure_utc():
+    if hasattr(time, "tzset") and os.environ.get("TZ") != "UTC":
+        os.environ["TZ"] = "UTC"
+        time.tzset()
+
 
 # ===== DBAPI =====
 # https://peps.python.org/pep-0249/
@@ -62,28 +137,94 @@ class Error(Exception):
 class Cursor(psycopg2.extensions.cursor):
     def execute(self, query, vars=None):
         """execute(query, vars=None) -- Execute query with bound vars."""
-        return super().execute(remove_public_schema(query), vars)
+        if isinstance(query, str):
+            query = rewrite_query(query)
+        return super().execute(query, vars)
+
+
+# psycopg2's own cursor, used when connecting with rewrite_sql=False, the
+# public schema is then removed by the SQLAlchemy engine before execution
+NativeCursor = psycopg2.extensions.cursor
 
 
 def cursor_factory(*args, **kwargs):
     return Cursor(*args, **kwargs)
 
 
+def connect_pool(**kwargs):
+    """Checks out a connection from the process wide pool for the connection
+    attributes, the pool is created on first use with the max_idle, ttl and
+    maxconn arguments. Closing the connection returns it to the pool."""
+    _ensure_utc()
+    conn_attrs = _connection_attrs(**kwargs)
+    key = tuple(conn_attrs.values())
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                functools.partial(psycopg2.connect, **conn_attrs),
+                max_idle=kwargs.get("max_idle", 10),
+                ttl=kwargs.get("ttl", 300.0),
+                maxconn=kwargs.get("maxconn", 30),
+            )
+            _POOLS[key] = pool
+    conn = pool.getconn()
+    conn.cursor_factory = _cursor_factory(**kwargs)
+    return conn
+
+
 def connect(**kwargs):
-    host = kwargs.get("host") or "127.0.0.1"
-    port = kwargs.get("port") or 8812
-    user = kwargs.get("user") or "admin"
-    password = kwargs.get("password") or "quest"
-    database = kwargs.get("database") or "main"
-    conn = psycopg2.connect(
-        cursor_factory=cursor_factory,
-        host=host,
-        port=port,
-        user=user,
-        password=password,
-        database=database,
-    )
+    _ensure_utc()
+    conn = None
+    # SQLAlchemy engines connect with pooled=False, they have their own pool
+    if kwargs.get("pooled", True) and _pool_enabled():
+        try:
+            conn = connect_pool(**kwargs)
+        except psycopg2.pool.PoolError:
+            pass  # pool exhausted
+    if conn is None:
+        conn = psycopg2.connect(
+            cursor_factory=_cursor_factory(**kwargs), **_connection_attrs(**kwargs)
+        )
     # retrieve and cache function names and keywords lists
-    get_keywords_list(conn)
-    get_functions_list(conn)
+    initialize_keywords_functions(conn)
     return conn
+
+
+def _connection_attrs(**kwargs):
+    return {
+        "host": kwargs.get("host") or "127.0.0.1",
+        "port": kwargs.get("port") or 8812,
+        "user": kwargs.get("user") or "admin",
+        "password": kwargs.get("password") or "quest",
+        "database": kwargs.get("database") or "main",
+    }
+
+
+def _cursor_factory(**kwargs):
+    rewrite_sql = kwargs.get("rewrite_sql", True)
+    if isinstance(rewrite_sql, str):
+        rewrite_sql = rewrite_sql.lower() not in ("0", "false", "no", "off")
+    return cursor_factory if rewrite_sql else NativeCursor
+
+
+def _pool_enabled():
+    # set QUESTDB_CONNECT_POOL=false to open a new connection on each connect()
+    return os.environ.get("QUESTDB_CONNECT_POOL", "true").lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def _close_pools():
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.closeall()
+        _POOLS.clear()
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+atexit.register(_close_pools)
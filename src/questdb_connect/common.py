@@ -1,4 +1,5 @@
 import enum
+import functools
 import re
 
 
@@ -17,9 +18,18 @@ def remove_public_schema(query):
     return query
 
 
+@functools.lru_cache(maxsize=1024)
+def rewrite_query(query: str):
+    """remove_public_schema, cached for SQL texts that are executed repeatedly."""
+    return remove_public_schema(query)
+
+
 def quote_identifier(identifier: str):
     if not identifier:
         return None
+    if identifier[0] not in _QUOTES and identifier[-1] not in _QUOTES:
+        # fast path, identifiers are seldom quoted already
+        return f'"{identifier}"'
     first = 0
     last = len(identifier)
     if identifier[first] in _QUOTES:
@@ -32,4 +42,4 @@ def quote_identifier(identifier: str):
 _PUBLIC_SCHEMA_FILTER = re.compile(
     r"(')?(public(?(1)\1|)\.)", re.IGNORECASE | re.MULTILINE
 )
-_QUOTES = ("'", '"')
+_QUOTES = frozenset(("'", '"'))
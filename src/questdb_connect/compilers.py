@@ -3,7 +3,6 @@ import abc
 import sqlalchemy
 
 from .common import quote_identifier, remove_public_schema
-from .types import QDBTypeMixin
 
 
 class QDBDDLCompiler(sqlalchemy.sql.compiler.DDLCompiler, abc.ABC):
@@ -17,12 +16,12 @@ class QDBDDLCompiler(sqlalchemy.sql.compiler.DDLCompiler, abc.ABC):
         table = create.element
         create_table = f"CREATE TABLE {quote_identifier(table.fullname)} ("
         create_table += ", ".join(
-            [self.get_column_specification(c.element) for c in create.columns]
+            self.get_column_specification(c.element) for c in create.columns
         )
         return create_table + ") " + table.engine.get_table_suffix()
 
     def get_column_specification(self, column: sqlalchemy.Column, **_):
-        if not isinstance(column.type, QDBTypeMixin):
+        if not getattr(type(column.type), "_qdb_type", False):
             raise sqlalchemy.exc.ArgumentError(
                 "Column type is not a valid QuestDB type"
             )
@@ -34,5 +33,8 @@ class QDBSQLCompiler(sqlalchemy.sql.compiler.SQLCompiler, abc.ABC):
         return True
 
     def visit_textclause(self, textclause, add_to_result_map=None, **kw):
-        textclause.text = remove_public_schema(textclause.text)
-        return super().visit_textclause(textclause, add_to_result_map, **kw)
+        # rewrite the compiled string rather than the clause itself, the clause
+        # is part of the statement cache key and must not change after compiling
+        return remove_public_schema(
+            super().visit_textclause(textclause, add_to_result_map, **kw)
+        )
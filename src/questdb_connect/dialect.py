@@ -1,9 +1,12 @@
-import abc
+import atexit
+import functools
+import threading
 
 import sqlalchemy
 from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
 from sqlalchemy.sql.compiler import GenericTypeCompiler
 
+from .common import rewrite_query
 from .compilers import QDBDDLCompiler, QDBSQLCompiler
 from .identifier_preparer import QDBIdentifierPreparer
 from .inspector import QDBInspector
@@ -21,16 +24,59 @@ def connection_uri(
 def create_engine(
     host: str, port: int, username: str, password: str, database: str = "main"
 ):
-    return sqlalchemy.create_engine(
-        connection_uri(host, port, username, password, database),
-        future=False,
-        hide_parameters=False,
-        implicit_returning=False,
-        isolation_level="REPEATABLE READ",
-    )
-
-
-class QuestDBDialect(PGDialect_psycopg2, abc.ABC):
+    """Returns the engine shared by all callers using the same connection
+    attributes, so that its connection pool is reused rather than rebuilt."""
+    key = (host, int(port), username, password, database)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(key)
+            if engine is None:
+                engine = sqlalchemy.create_engine(
+                    connection_uri(host, port, username, password, database),
+                    future=False,
+                    hide_parameters=False,
+                    implicit_returning=False,
+                    isolation_level="REPEATABLE READ",
+                    poolclass=sqlalchemy.pool.QueuePool,
+                    pool_size=10,
+                    max_overflow=20,
+                    pool_recycle=300,
+                    pool_pre_ping=True,
+                )
+                _ENGINES[key] = engine
+    return engine
+
+
+def _dispose_engines():
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+
+
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+atexit.register(_dispose_engines)
+
+
+_SHOW_TABLES = sqlalchemy.text("SHOW tables")
+_HAS_TABLE = sqlalchemy.text(
+    "SELECT count() FROM tables() WHERE table_name = :table_name"
+)
+_HAS_TABLE_LEGACY = sqlalchemy.text(
+    "SELECT count() FROM tables() WHERE name = :table_name"
+)
+_TABLE_COLUMNS = sqlalchemy.text("table_columns(:table_name)")
+
+
+@functools.lru_cache(maxsize=None)
+def get_dialect():
+    """Returns a shared QuestDBDialect, without the cost of creating an engine."""
+    return QuestDBDialect()
+
+
+class QuestDBDialect(PGDialect_psycopg2):
     name = "questdb"
     psycopg2_version = (2, 9)
     default_schema_name = "public"
@@ -40,7 +86,7 @@ class QuestDBDialect(PGDialect_psycopg2, abc.ABC):
     inspector = QDBInspector
     preparer = QDBIdentifierPreparer
     supports_schemas = False
-    supports_statement_cache = False
+    supports_statement_cache = True
     supports_server_side_cursors = False
     supports_native_boolean = True
     supports_views = False
@@ -54,6 +100,26 @@ class QuestDBDialect(PGDialect_psycopg2, abc.ABC):
     _user_defined_max_identifier_length = 255
     _has_native_hstore = False
     supports_is_distinct_from = False
+    _legacy_tables = False
+
+    def __init__(self, rewrite_sql=True, **kwargs):
+        super().__init__(**kwargs)
+        # with rewrite_sql=False connections use psycopg2's native cursor and
+        # the engine removes the public schema in a before_cursor_execute hook,
+        # SQL executed on raw DBAPI connections is then not rewritten
+        self.rewrite_sql = rewrite_sql
+
+    @classmethod
+    def engine_created(cls, engine):
+        if not engine.dialect.rewrite_sql:
+            sqlalchemy.event.listen(
+                engine, "before_cursor_execute", _rewrite_statement, retval=True
+            )
+
+    def connect(self, *cargs, **cparams):
+        cparams["rewrite_sql"] = self.rewrite_sql
+        cparams["pooled"] = False
+        return super().connect(*cargs, **cparams)
 
     @classmethod
     def dbapi(cls):
@@ -65,15 +131,40 @@ class QuestDBDialect(PGDialect_psycopg2, abc.ABC):
         return ["public"]
 
     def get_table_names(self, conn, schema=None, **kw):
-        return [row.table_name for row in self._exec(conn, "SHOW tables")]
+        return [row.table_name for row in conn.execute(_SHOW_TABLES)]
 
     def has_table(self, conn, table_name, schema=None):
-        return table_name in set(self.get_table_names(conn, schema))
+        result_set = self.execute_tables_query(
+            conn, _HAS_TABLE, _HAS_TABLE_LEGACY, {"table_name": table_name}
+        )
+        return bool(result_set.scalar())
+
+    def execute_tables_query(self, conn, stmt, legacy_stmt, params):
+        """Executes a query on tables(), or its legacy form for older versions,
+        where tables() has column 'name' instead of 'table_name'."""
+        if not self._legacy_tables:
+            try:
+                return conn.execute(stmt, params)
+            except sqlalchemy.exc.ProgrammingError:
+                if (
+                    isinstance(conn, sqlalchemy.engine.Connection)
+                    and conn.in_transaction()
+                ):
+                    # the failed query left the transaction in error
+                    conn.connection.rollback()
+            result_set = conn.execute(legacy_stmt, params)
+            self._legacy_tables = True
+            return result_set
+        return conn.execute(legacy_stmt, params)
+
+    @sqlalchemy.engine.reflection.cache
+    def get_table_columns(self, conn, table_name, schema=None, **kw):
+        return conn.execute(_TABLE_COLUMNS, {"table_name": table_name}).fetchall()
 
     @sqlalchemy.engine.reflection.cache
     def get_columns(self, conn, table_name, schema=None, **kw):
         return self.inspector.format_table_columns(
-            table_name, self._exec(conn, f"table_columns('{table_name}')")
+            table_name, self.get_table_columns(conn, table_name, schema, **kw)
         )
 
     def get_pk_constraint(self, conn, table_name, schema=None, **kw):
@@ -134,5 +225,6 @@ class QuestDBDialect(PGDialect_psycopg2, abc.ABC):
     def get_isolation_level(self, dbapi_conn):
         return None
 
-    def _exec(self, conn, sql_query):
-        return conn.execute(sqlalchemy.text(sql_query))
+
+def _rewrite_statement(conn, cursor, statement, parameters, context, executemany):
+    return rewrite_query(statement), parameters
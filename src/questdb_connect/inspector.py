@@ -1,12 +1,16 @@
 import abc
 
-import psycopg2
 import sqlalchemy
+import sqlalchemy.orm.exc
 
 from .common import PartitionBy
 from .table_engine import QDBTableEngine
 from .types import resolve_type_from_name
 
+# bound table names keep a single SQL text, and compiled statement, per query
+_TABLES = sqlalchemy.text("tables() WHERE table_name = :table_name")
+_TABLES_LEGACY = sqlalchemy.text("tables() WHERE name = :table_name")
+
 
 class QDBInspector(sqlalchemy.engine.reflection.Inspector, abc.ABC):
     def reflecttable(
@@ -31,13 +35,9 @@ class QDBInspector(sqlalchemy.engine.reflection.Inspector, abc.ABC):
         _extend_on=None,
     ):
         table_name = table.name
-        try:
-            result_set = self.bind.execute(
-                f"tables() WHERE table_name = '{table_name}'"
-            )
-        except psycopg2.DatabaseError:
-            # older version
-            result_set = self.bind.execute(f"tables() WHERE name = '{table_name}'")
+        result_set = self.dialect.execute_tables_query(
+            self.bind, _TABLES, _TABLES_LEGACY, {"table_name": table_name}
+        )
         if not result_set:
             self._panic_table(table_name)
         table_attrs = result_set.first()
@@ -50,7 +50,7 @@ class QDBInspector(sqlalchemy.engine.reflection.Inspector, abc.ABC):
             partition_by = PartitionBy.NONE
             is_wal = True
         dedup_upsert_keys = []
-        for row in self.bind.execute(f"table_columns('{table_name}')"):
+        for row in self._get_table_columns(table_name):
             col_name = row[0]
             if include_columns and col_name not in include_columns:
                 continue
@@ -75,15 +75,18 @@ class QDBInspector(sqlalchemy.engine.reflection.Inspector, abc.ABC):
         table.metadata = sqlalchemy.MetaData()
 
     def get_columns(self, table_name, schema=None, **kw):
-        result_set = self.bind.execute(f"table_columns('{table_name}')")
-        return self.format_table_columns(table_name, result_set)
+        with self._operation_context() as conn:
+            return self.dialect.get_columns(
+                conn, table_name, schema, info_cache=self.info_cache, **kw
+            )
 
     def get_schema_names(self):
         return ["public"]
 
-    def format_table_columns(self, table_name, result_set):
+    @staticmethod
+    def format_table_columns(table_name, result_set):
         if not result_set:
-            self._panic_table(table_name)
+            QDBInspector._panic_table(table_name)
         return [
             {
                 "name": row[0],
@@ -94,5 +97,14 @@ class QDBInspector(sqlalchemy.engine.reflection.Inspector, abc.ABC):
             for row in result_set
         ]
 
-    def _panic_table(self, table_name):
+    def _get_table_columns(self, table_name):
+        # rows are kept in the info cache, repeated reflection of the
+        # same table through this inspector does not go back to the server
+        with self._operation_context() as conn:
+            return self.dialect.get_table_columns(
+                conn, table_name, info_cache=self.info_cache
+            )
+
+    @staticmethod
+    def _panic_table(table_name):
         raise sqlalchemy.orm.exc.NoResultFound(f"Table '{table_name}' does not exist")
@@ -1,3 +1,6 @@
+import threading
+
+
 def get_keywords_list(conn=None):
     return __initialize_list(
         conn, "SELECT keyword FROM keywords()", __keywords, __default_keywords
@@ -10,18 +13,55 @@ def get_functions_list(conn=None):
     )
 
 
-def __initialize_list(conn, sql_stmt, target_list, default_target_list):
-    if not target_list:
+def initialize_keywords_functions(conn):
+    """Retrieves and caches both the keywords and function names lists,
+    in a single round trip. Once cached, no query is issued."""
+    if __keywords and __func_names:
+        return
+    with __lock:
+        if __keywords and __func_names:
+            return
+        keywords = []
+        func_names = []
         try:
-            with conn.cursor() as functions_cur:
-                functions_cur.execute(sql_stmt)
-                for func_row in functions_cur.fetchall():
-                    target_list.append(func_row[0])
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT 'k' kind, keyword name FROM keywords() "
+                    "UNION ALL SELECT 'f' kind, name FROM functions()"
+                )
+                for kind, name in cur.fetchall():
+                    (keywords if kind == "k" else func_names).append(name)
         except Exception as _ignore:
-            target_list.extend(default_target_list)
+            # leave the transaction usable for the per list queries below
+            conn.rollback()
+        if keywords and func_names:
+            __keywords[:] = keywords
+            __func_names[:] = func_names
+        else:
+            # one list per query, falling back to the defaults
+            get_keywords_list(conn)
+            get_functions_list(conn)
+
+
+def __initialize_list(conn, sql_stmt, target_list, default_target_list):
+    if not target_list:
+        with __lock:
+            if not target_list:
+                try:
+                    with conn.cursor() as functions_cur:
+                        functions_cur.execute(sql_stmt)
+                        for func_row in functions_cur.fetchall():
+                            target_list.append(func_row[0])
+                except Exception as _ignore:
+                    if conn is not None:
+                        conn.rollback()
+                    target_list.extend(default_target_list)
     return target_list
 
 
+__lock = threading.RLock()
+
+
 __func_names = []
 __default_func_names = [
     "abs",
@@ -0,0 +1,134 @@
+import collections
+import threading
+import time
+import weakref
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+
+class ConnectionPool:
+    """Thread safe pool of psycopg2 connections, opened on demand by calling
+    `connect`. Up to `max_idle` returned connections are kept open, each for
+    at most `ttl` seconds, and at most `maxconn` connections can be checked
+    out at once, past which getconn raises PoolError. A handle dropped without
+    close() gives up its slot and its connection is never reused, it closes
+    once nothing, a cursor for instance, references it anymore."""
+
+    def __init__(self, connect, max_idle=10, ttl=300.0, maxconn=30):
+        self._connect = connect
+        self._max_idle = max_idle
+        self._ttl = ttl
+        self._maxconn = maxconn
+        self._idle = collections.deque()  # (expiry, connection), newest last
+        self._checked_out = weakref.WeakSet()
+        self._connecting = 0
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def getconn(self):
+        expired = []
+        with self._lock:
+            if self.closed:
+                raise psycopg2.pool.PoolError("connection pool is closed")
+            if len(self._checked_out) + self._connecting >= self._maxconn:
+                raise psycopg2.pool.PoolError("connection pool exhausted")
+            now = time.monotonic()
+            while self._idle and self._idle[0][0] <= now:
+                expired.append(self._idle.popleft()[1])
+            conn = self._idle.pop()[1] if self._idle else None
+            self._connecting += 1
+        try:
+            for stale_conn in expired:
+                stale_conn.close()
+            if conn is None or conn.closed:
+                conn = self._connect()
+            handle = PooledConnection(self, conn)
+            with self._lock:
+                self._checked_out.add(handle)
+            return handle
+        finally:
+            with self._lock:
+                self._connecting -= 1
+
+    def closeall(self):
+        with self._lock:
+            self.closed = True
+            idle = [conn for _, conn in self._idle]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _release(self, handle, conn):
+        with self._lock:
+            self._checked_out.discard(handle)
+        if not conn.closed:
+            try:
+                status = conn.info.transaction_status
+                if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                    conn.close()  # connection is broken
+                elif _has_session_settings(conn):
+                    conn.close()  # not carried over to the next user
+                else:
+                    if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                        conn.rollback()
+                    conn.autocommit = False
+            except psycopg2.Error:
+                conn.close()
+        if not conn.closed:
+            with self._lock:
+                if not self.closed and len(self._idle) < self._max_idle:
+                    self._idle.append((time.monotonic() + self._ttl, conn))
+                    return
+            conn.close()
+
+
+class PooledConnection:
+    """Connection checked out of a ConnectionPool, it behaves as the psycopg2
+    connection it wraps. close() returns that connection to the pool and
+    leaves this handle unusable, as closing a plain connection would."""
+
+    def __init__(self, pool, conn):
+        self.__dict__["_pool"] = pool
+        self.__dict__["_conn"] = conn
+
+    @property
+    def closed(self):
+        conn = self.__dict__["_conn"]
+        return 1 if conn is None else conn.closed
+
+    def close(self):
+        """close() -- Return the connection to its pool."""
+        conn = self.__dict__["_conn"]
+        if conn is not None:
+            self.__dict__["_conn"] = None
+            self._pool._release(self, conn)
+
+    def __getattr__(self, name):
+        return getattr(self._connection(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection(), name, value)
+
+    def __enter__(self):
+        self._connection().__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._connection().__exit__(exc_type, exc_value, traceback)
+
+    def _connection(self):
+        conn = self.__dict__["_conn"]
+        if conn is None:
+            raise psycopg2.InterfaceError("connection already closed")
+        return conn
+
+
+def _has_session_settings(conn):
+    # set by set_session / set_isolation_level, None when left to the server
+    return (
+        conn.isolation_level is not None
+        or conn.readonly is not None
+        or conn.deferrable is not None
+    )
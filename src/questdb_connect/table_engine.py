@@ -1,3 +1,4 @@
+import functools
 import typing
 
 import sqlalchemy
@@ -22,42 +23,46 @@ class QDBTableEngine(
         self.partition_by = partition_by
         self.is_wal = is_wal
         self.dedup_upsert_keys = dedup_upsert_keys
-        self.compiled = None
 
     def get_table_suffix(self):
-        if self.compiled is None:
-            self.compiled = ""
-            has_ts = self.ts_col_name is not None
-            is_partitioned = self.partition_by and self.partition_by != PartitionBy.NONE
-            if has_ts:
-                self.compiled += f'TIMESTAMP("{self.ts_col_name}")'
-            if is_partitioned:
-                if not has_ts:
-                    raise sqlalchemy.exc.ArgumentError(
-                        None,
-                        "Designated timestamp must be specified for partitioned table",
-                    )
-                self.compiled += f" PARTITION BY {self.partition_by.name}"
-            if self.is_wal:
-                if not is_partitioned:
-                    raise sqlalchemy.exc.ArgumentError(
-                        None, "WAL table requires designated timestamp and partition by"
-                    )
-                if self.is_wal:
-                    self.compiled += " WAL"
-                    if self.dedup_upsert_keys:
-                        self.compiled += " DEDUP UPSERT KEYS("
-                        self.compiled += ",".join(
-                            map(quote_identifier, self.dedup_upsert_keys)
-                        )
-                        self.compiled += ")"
-                else:
-                    if self.dedup_upsert_keys:
-                        raise sqlalchemy.exc.ArgumentError(
-                            None, "DEDUP only applies to WAL tables"
-                        )
-                    self.compiled += " BYPASS WAL"
-        return self.compiled
+        return _compile_suffix(
+            self.ts_col_name,
+            self.partition_by,
+            self.is_wal,
+            tuple(self.dedup_upsert_keys) if self.dedup_upsert_keys else None,
+        )
 
     def _set_parent(self, parent, **_kwargs):
         parent.engine = self
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_suffix(ts_col_name, partition_by, is_wal, dedup_upsert_keys):
+    compiled = ""
+    has_ts = ts_col_name is not None
+    is_partitioned = partition_by and partition_by != PartitionBy.NONE
+    if has_ts:
+        compiled += f'TIMESTAMP("{ts_col_name}")'
+    if is_partitioned:
+        if not has_ts:
+            raise sqlalchemy.exc.ArgumentError(
+                None,
+                "Designated timestamp must be specified for partitioned table",
+            )
+        compiled += f" PARTITION BY {partition_by.name}"
+    if is_wal:
+        if not is_partitioned:
+            raise sqlalchemy.exc.ArgumentError(
+                None, "WAL table requires designated timestamp and partition by"
+            )
+        compiled += " WAL"
+        if dedup_upsert_keys:
+            compiled += " DEDUP UPSERT KEYS("
+            compiled += ",".join(map(quote_identifier, dedup_upsert_keys))
+            compiled += ")"
+    else:
+        if dedup_upsert_keys:
+            raise sqlalchemy.exc.ArgumentError(None, "DEDUP only applies to WAL tables")
+        if is_partitioned:
+            compiled += " BYPASS WAL"
+    return compiled
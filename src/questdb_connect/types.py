@@ -6,10 +6,6 @@ _GEOHASH_BYTE_MAX = 8
 _GEOHASH_SHORT_MAX = 16
 _GEOHASH_INT_MAX = 32
 _GEOHASH_LONG_BITS = 60
-_TYPE_CACHE = {
-    # key:   '__visit_name__' of the implementor of QDBTypeMixin
-    # value: implementor class itself
-}
 
 
 def geohash_type_name(bits):
@@ -44,10 +40,7 @@ class QDBTypeMixin(sqlalchemy.types.TypeDecorator):
     __visit_name__ = "QDBTypeMixin"
     impl = sqlalchemy.types.String
     cache_ok = True
-
-    @classmethod
-    def matches_type_name(cls, type_name):
-        return cls if type_name == cls.__visit_name__ else None
+    _qdb_type = True  # cheaper than isinstance in DDL compilation
 
     def column_spec(self, column_name):
         return f"{quote_identifier(column_name)} {self.__visit_name__}"
@@ -165,49 +158,49 @@ class IPv4(QDBTypeMixin):
     type_code = 26
 
 
-QUESTDB_TYPES = [
-    Boolean,
-    Byte,
-    Short,
-    Char,
-    Int,
-    Long,
-    Date,
-    Timestamp,
-    Float,
-    Double,
-    String,
-    Symbol,
-    Long256,
-    GeohashByte,
-    GeohashInt,
-    GeohashShort,
-    GeohashLong,
-    UUID,
-    Long128,
-    IPv4,
-]
+QUESTDB_TYPES = frozenset(
+    (
+        Boolean,
+        Byte,
+        Short,
+        Char,
+        Int,
+        Long,
+        Date,
+        Timestamp,
+        Float,
+        Double,
+        String,
+        Symbol,
+        Long256,
+        GeohashByte,
+        GeohashInt,
+        GeohashShort,
+        GeohashLong,
+        UUID,
+        Long128,
+        IPv4,
+    )
+)
+
+
+# key:   lower case '__visit_name__' of the implementor of QDBTypeMixin,
+#        plus every GEOHASH(<n>b) and GEOHASH(<n>c) precision
+# value: implementor class itself
+_RESOLVER = {
+    **{type_class.__visit_name__.lower(): type_class for type_class in QUESTDB_TYPES},
+    **{
+        f"geohash({bits}b)": geohash_class(bits)
+        for bits in range(1, _GEOHASH_LONG_BITS + 1)
+    },
+    **{
+        f"geohash({chars}c)": geohash_class(chars * 5)
+        for chars in range(1, _GEOHASH_LONG_BITS // 5 + 1)
+    },
+}
 
 
 def resolve_type_from_name(type_name):
     if not type_name:
         return None
-    type_class = _TYPE_CACHE.get(type_name)
-    if not type_class:
-        for candidate_class in QUESTDB_TYPES:
-            type_class = candidate_class.matches_type_name(type_name)
-            if type_class:
-                _TYPE_CACHE[type_name] = type_class
-                break
-            elif (
-                "GEOHASH" in type_name.upper() and "(" in type_name and ")" in type_name
-            ):
-                open_p = type_name.index("(")
-                close_p = type_name.index(")")
-                description = type_name[open_p + 1 : close_p]
-                g_size = int(description[:-1])
-                if description[-1] in ("C", "c"):
-                    g_size *= 5
-                type_class = geohash_class(g_size)
-                break
-    return type_class
+    return _RESOLVER.get(type_name.lower())
@@ -1,4 +1,6 @@
+import itertools
 import os
+import time
 from typing import NamedTuple
 
 import pytest
@@ -34,23 +36,17 @@ def test_config_fixture() -> TestConfig:
 
 @pytest.fixture(scope='module', name='test_engine')
 def test_engine_fixture(test_config: TestConfig):
-    engine = None
-    try:
-        engine = qdbc.create_engine(
-            test_config.host,
-            test_config.port,
-            test_config.username,
-            test_config.password,
-            test_config.database)
-        return engine
-    finally:
-        if engine:
-            engine.dispose()
-            del engine
+    # the engine is shared across modules, it is disposed of at exit
+    return qdbc.create_engine(
+        test_config.host,
+        test_config.port,
+        test_config.username,
+        test_config.password,
+        test_config.database)
 
 
-@pytest.fixture(autouse=True, name='test_model')
-def test_model_fixture(test_engine):
+@pytest.fixture(scope='session', name='all_types_model')
+def all_types_model_fixture():
     Base = declarative_base(metadata=MetaData())
 
     class TableModel(Base):
@@ -72,13 +68,11 @@ def test_model_fixture(test_engine):
         col_geohash = Column('col_geohash', qdbc.GeohashInt)
         col_long256 = Column('col_long256', qdbc.Long256)
 
-    Base.metadata.drop_all(test_engine)
-    Base.metadata.create_all(test_engine)
     return TableModel
 
 
-@pytest.fixture(autouse=True, name='test_metrics')
-def test_metrics_fixture(test_engine):
+@pytest.fixture(scope='session', name='metrics_model')
+def metrics_model_fixture():
     Base = declarative_base(metadata=MetaData())
 
     class TableMetrics(Base):
@@ -97,26 +91,62 @@ def test_metrics_fixture(test_engine):
         attr_value = Column(qdbc.Double)
         ts = Column(qdbc.Timestamp, primary_key=True)
 
-    Base.metadata.drop_all(test_engine)
-    Base.metadata.create_all(test_engine)
     return TableMetrics
 
 
+@pytest.fixture(autouse=True, name='test_model')
+def test_model_fixture(test_engine, all_types_model):
+    # the model is built once per session, each test starts from an empty table
+    all_types_model.metadata.drop_all(test_engine)
+    all_types_model.metadata.create_all(test_engine)
+    return all_types_model
+
+
+@pytest.fixture(autouse=True, name='test_metrics')
+def test_metrics_fixture(test_engine, metrics_model):
+    metrics_model.metadata.drop_all(test_engine)
+    metrics_model.metadata.create_all(test_engine)
+    return metrics_model
+
+
 def collect_select_all(session, expected_rows) -> str:
-    while True:
+    for _ in _backoff():
         rs = session.execute(text(f'select * from public.{ALL_TYPES_TABLE_NAME} order by 1 asc'))
         if rs.rowcount == expected_rows:
-            return '\n'.join(str(row) for row in rs)
+            return '\n'.join(str(row) for row in rs.fetchall())
+    raise TimeoutError(f'expected {expected_rows} rows in {ALL_TYPES_TABLE_NAME}')
+
+
+def collect_select_all_driver_sql(conn, expected_rows) -> str:
+    # the SQL text skips SQLAlchemy's compiler, which removes the public schema
+    for _ in _backoff():
+        rs = conn.exec_driver_sql(f'select * from public.{ALL_TYPES_TABLE_NAME} order by 1 asc')
+        if rs.rowcount == expected_rows:
+            return '\n'.join(str(row) for row in rs.fetchall())
+    raise TimeoutError(f'expected {expected_rows} rows in {ALL_TYPES_TABLE_NAME}')
 
 
 def collect_select_all_raw_connection(test_engine, expected_rows) -> str:
     conn = test_engine.raw_connection()
     try:
-        while True:
+        for _ in _backoff():
             with conn.cursor() as cursor:
                 cursor.execute(f'select * from public.{ALL_TYPES_TABLE_NAME} order by 1 asc')
                 if cursor.rowcount == expected_rows:
-                    return '\n'.join(str(row) for row in cursor)
+                    return '\n'.join(str(row) for row in cursor.fetchall())
+        raise TimeoutError(f'expected {expected_rows} rows in {ALL_TYPES_TABLE_NAME}')
     finally:
         if conn:
             conn.close()
+
+
+def _backoff(timeout_secs=30.0):
+    # yields until the timeout expires, sleeping between attempts with
+    # an exponential backoff, WAL tables apply inserts asynchronously
+    deadline = time.monotonic() + timeout_secs
+    for delay in itertools.chain((0.01, 0.02, 0.05, 0.1, 0.2, 0.5), itertools.repeat(1.0)):
+        yield
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(delay, remaining))
@@ -8,6 +8,7 @@ from tests.conftest import (
     ALL_TYPES_TABLE_NAME,
     METRICS_TABLE_NAME,
     collect_select_all,
+    collect_select_all_driver_sql,
     collect_select_all_raw_connection,
 )
 
@@ -249,3 +250,35 @@ def test_keywords(test_engine):
     with test_engine.connect() as conn:
         expected = [row[0] for row in conn.execute("SELECT keyword FROM keywords()").fetchall()]
         assert qdbc.get_keywords_list() == expected
+
+
+def test_create_engine_is_shared(test_config, test_engine):
+    engine = qdbc.create_engine(
+        test_config.host,
+        test_config.port,
+        test_config.username,
+        test_config.password,
+        test_config.database)
+    assert engine is test_engine
+
+
+def test_native_cursor_engine(test_config, test_model):
+    engine = sqla.create_engine(
+        qdbc.connection_uri(
+            test_config.host,
+            test_config.port,
+            test_config.username,
+            test_config.password,
+            test_config.database),
+        rewrite_sql=False)
+    try:
+        with engine.connect() as conn:
+            assert not isinstance(conn.connection.cursor(), qdbc.Cursor)
+            conn.execute(sqla.insert(test_model).values(
+                col_symbol='coconut',
+                col_ts=datetime.datetime(2023, 4, 12, 23, 55, 59, 342380)
+            ))
+            # the before_cursor_execute hook removes the public schema
+            assert 'coconut' in collect_select_all_driver_sql(conn, expected_rows=1)
+    finally:
+        engine.dispose()
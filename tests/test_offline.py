@@ -0,0 +1,186 @@
+import gc
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+import pytest
+import questdb_connect as qdbc
+import sqlalchemy as sqla
+from questdb_connect.pool import ConnectionPool
+
+
+# tests in this module do not need a QuestDB server, these override
+# the autouse fixtures in conftest.py that create the test tables
+@pytest.fixture(autouse=True, name='test_model')
+def test_model_fixture():
+    return None
+
+
+@pytest.fixture(autouse=True, name='test_metrics')
+def test_metrics_fixture():
+    return None
+
+
+def test_table_engine_suffix():
+    wal = qdbc.QDBTableEngine('t', 'ts', qdbc.PartitionBy.DAY, is_wal=True, dedup_upsert_keys=('ts',))
+    assert wal.get_table_suffix() == 'TIMESTAMP("ts") PARTITION BY DAY WAL DEDUP UPSERT KEYS("ts")'
+    bypass = qdbc.QDBTableEngine('t', 'ts', qdbc.PartitionBy.HOUR, is_wal=False)
+    assert bypass.get_table_suffix() == 'TIMESTAMP("ts") PARTITION BY HOUR BYPASS WAL'
+    not_partitioned = qdbc.QDBTableEngine('t', 'ts', qdbc.PartitionBy.NONE, is_wal=False)
+    assert not_partitioned.get_table_suffix() == 'TIMESTAMP("ts")'
+
+
+def test_table_engine_suffix_errors():
+    dedup_no_wal = qdbc.QDBTableEngine('t', 'ts', qdbc.PartitionBy.DAY, is_wal=False, dedup_upsert_keys=('ts',))
+    with pytest.raises(sqla.exc.ArgumentError, match='DEDUP only applies to WAL tables'):
+        dedup_no_wal.get_table_suffix()
+    wal_not_partitioned = qdbc.QDBTableEngine('t', 'ts', qdbc.PartitionBy.NONE, is_wal=True)
+    with pytest.raises(sqla.exc.ArgumentError, match='WAL table requires'):
+        wal_not_partitioned.get_table_suffix()
+
+
+def test_get_dialect_is_shared():
+    assert qdbc.get_dialect() is qdbc.get_dialect()
+    assert isinstance(qdbc.get_dialect(), qdbc.QuestDBDialect)
+
+
+class FakeConnection:
+    def __init__(self, **_kwargs):
+        self.closed = 0
+        self.autocommit = False
+        self.cursor_factory = None
+        self.isolation_level = None
+        self.readonly = None
+        self.deferrable = None
+        self.info = SimpleNamespace(transaction_status=psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+
+    def rollback(self):
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def test_pool_checkout_return():
+    pool = ConnectionPool(FakeConnection)
+    conn = pool.getconn()
+    raw_conn = conn._connection()
+    conn.autocommit = True
+    raw_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+    conn.close()
+    assert conn.closed
+    with pytest.raises(psycopg2.InterfaceError):
+        conn.cursor()
+    assert not raw_conn.closed
+    assert raw_conn.autocommit is False
+    assert raw_conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    conn.close()  # closing twice is harmless
+    assert pool.getconn()._connection() is raw_conn
+
+
+def test_pool_idle_limits():
+    pool = ConnectionPool(FakeConnection, max_idle=1)
+    conn_1, conn_2 = pool.getconn(), pool.getconn()
+    raw_conn_1, raw_conn_2 = conn_1._connection(), conn_2._connection()
+    conn_1.close()
+    conn_2.close()
+    assert not raw_conn_1.closed
+    assert raw_conn_2.closed  # over max_idle
+    expiring_pool = ConnectionPool(FakeConnection, ttl=0)
+    conn = expiring_pool.getconn()
+    raw_conn = conn._connection()
+    conn.close()
+    assert expiring_pool.getconn()._connection() is not raw_conn
+    assert raw_conn.closed  # expired
+
+
+def test_pool_session_settings():
+    pool = ConnectionPool(FakeConnection)
+    conn = pool.getconn()
+    raw_conn = conn._connection()
+    conn.readonly = True
+    conn.close()
+    assert raw_conn.closed  # session settings are not carried over
+    assert pool.getconn()._connection() is not raw_conn
+
+
+def test_pool_dropped_handle():
+    pool = ConnectionPool(FakeConnection, maxconn=1)
+    conn = pool.getconn()
+    raw_conn = conn._connection()
+    del conn  # e.g. qdbc.connect().cursor(), the cursor keeps raw_conn
+    gc.collect()
+    conn = pool.getconn()  # the slot is free
+    assert conn._connection() is not raw_conn
+    assert not raw_conn.closed
+
+
+def test_pool_exhausted():
+    pool = ConnectionPool(FakeConnection, maxconn=1)
+    conn = pool.getconn()
+    with pytest.raises(psycopg2.pool.PoolError):
+        pool.getconn()
+    conn.close()
+    pool.getconn().close()
+    pool.closeall()
+    with pytest.raises(psycopg2.pool.PoolError):
+        pool.getconn()
+
+
+def test_connect_falls_back_when_pool_exhausted(monkeypatch):
+    monkeypatch.setattr(psycopg2, 'connect', FakeConnection)
+    monkeypatch.setattr(qdbc, '_POOLS', {})
+    monkeypatch.setattr(qdbc, 'initialize_keywords_functions', lambda conn: None)
+    pooled_conn = qdbc.connect(maxconn=1)
+    assert isinstance(pooled_conn, qdbc.PooledConnection)
+    assert pooled_conn.cursor_factory is qdbc.cursor_factory
+    assert isinstance(qdbc.connect(maxconn=1), FakeConnection)
+    pooled_conn.close()
+    assert isinstance(qdbc.connect(maxconn=1), qdbc.PooledConnection)
+    assert isinstance(qdbc.connect(pooled=False), FakeConnection)
+
+
+def test_import_does_not_load_sqlalchemy():
+    # a fresh interpreter, sqlalchemy is already loaded in this one
+    code = 'import sys, questdb_connect; print("sqlalchemy" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip() == 'False'
+
+
+def test_lazy_attributes():
+    assert qdbc.dialect.QuestDBDialect is qdbc.QuestDBDialect
+    assert qdbc.types.Int is qdbc.Int
+    star_imports = {}
+    exec('from questdb_connect import *', star_imports)  # noqa: S102
+    assert {'connect', 'create_engine', 'QDBTableEngine', 'Int'} <= set(star_imports)
+    with pytest.raises(AttributeError):
+        qdbc.no_such_attribute  # noqa: B018
+
+
+class FakeTablesConnection:
+    def __init__(self, error):
+        self.error = error
+        self.statements = []
+
+    def execute(self, stmt, _params):
+        self.statements.append(stmt.text)
+        if 'table_name =' in stmt.text:
+            raise self.error
+        return SimpleNamespace(scalar=lambda: 1)
+
+
+def test_has_table_legacy_fallback():
+    dialect = qdbc.QuestDBDialect()
+    conn = FakeTablesConnection(sqla.exc.ProgrammingError('tables()', {}, Exception('Invalid column: table_name')))
+    assert dialect.has_table(conn, 't')
+    assert conn.statements == [qdbc.dialect._HAS_TABLE.text, qdbc.dialect._HAS_TABLE_LEGACY.text]
+    assert dialect.has_table(conn, 't')
+    assert conn.statements[2:] == [qdbc.dialect._HAS_TABLE_LEGACY.text]  # the new form is only probed once
+    dialect = qdbc.QuestDBDialect()
+    conn = FakeTablesConnection(sqla.exc.OperationalError('tables()', {}, Exception('connection dropped')))
+    with pytest.raises(sqla.exc.OperationalError):
+        dialect.has_table(conn, 't')
+    assert not dialect._legacy_tables